@@ -5,393 +5,804 @@ Converts the CyPwn repository format to proper AltStore format
 Includes IPA analysis for app permissions extraction
 """
 
+import contextlib
+import functools
+import io
 import json
+import logging
+import multiprocessing
 import os
 import sys
-import subprocess
+import struct
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import zipfile
 import plistlib
 import tempfile
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Any
 from urllib.parse import urlparse
 import re
-from typing import Dict, List, Optional, Any
+from typing import BinaryIO, Dict, List, Mapping, Optional, Tuple, Union, Any
+from asn1crypto import cms
+
+try:
+    import orjson
+except ImportError:  # optional; the standard library json module is used instead
+    orjson = None
+
+log = logging.getLogger(__name__)
+
+# Mach-O and code signature magic numbers
+FAT_MAGIC = 0xcafebabe
+FAT_MAGIC_64 = 0xcafebabf
+MH_MAGIC = 0xfeedface
+MH_MAGIC_64 = 0xfeedfacf
+CPU_TYPE_ARM64 = 0x0100000c
+LC_CODE_SIGNATURE = 0x1d
+CSMAGIC_EMBEDDED_SIGNATURE = 0xfade0cc0
+CSMAGIC_EMBEDDED_ENTITLEMENTS = 0xfade7171
+
+# Downloads are read in 1 MiB chunks and kept in memory up to 256 MiB
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+IPA_SPOOL_MAX_SIZE = 256 << 20
+
+# Privacy-only analysis reads the zip central directory from the last 64 KiB of the IPA
+ZIP_TAIL_SIZE = 64 << 10
+# signature, flags, method, compressed size, name/extra/comment lengths, local header offset
+ZIP_CENTRAL_DIRECTORY_ENTRY = '<4s4xHH8xI4xHHH8xI'
+
+REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (iPhone; CPU iPhone OS 16_0 like Mac OS X) AppleWebKit/605.1.15'
+}
+
+PERMISSION_MAPPINGS = {
+    # Privacy descriptions that commonly appear in Info.plist
+    'NSCameraUsageDescription': 'Camera access',
+    'NSMicrophoneUsageDescription': 'Microphone access',
+    'NSPhotoLibraryUsageDescription': 'Photo Library access',
+    'NSPhotoLibraryAddUsageDescription': 'Photo Library write access',
+    'NSLocationWhenInUseUsageDescription': 'Location access when in use',
+    'NSLocationAlwaysAndWhenInUseUsageDescription': 'Location access always',
+    'NSContactsUsageDescription': 'Contacts access',
+    'NSCalendarsUsageDescription': 'Calendar access',
+    'NSRemindersUsageDescription': 'Reminders access',
+    'NSMotionUsageDescription': 'Motion and fitness access',
+    'NSHealthUpdateUsageDescription': 'Health data write access',
+    'NSHealthShareUsageDescription': 'Health data read access',
+    'NSBluetoothAlwaysUsageDescription': 'Bluetooth access',
+    'NSBluetoothPeripheralUsageDescription': 'Bluetooth peripheral access',
+    'NSLocalNetworkUsageDescription': 'Local network access',
+    'NSSpeechRecognitionUsageDescription': 'Speech recognition access',
+    'NSFaceIDUsageDescription': 'Face ID access',
+    'NSAppleMusicUsageDescription': 'Apple Music access',
+    'NSMediaLibraryUsageDescription': 'Media library access',
+    'NSNearbyInteractionUsageDescription': 'Nearby interaction access'
+}
+PERMISSION_KEYS = frozenset(map(sys.intern, PERMISSION_MAPPINGS))
+
+ENTITLEMENT_MAPPINGS = {
+    # Core iOS entitlements
+    'com.apple.security.application-groups': 'Application groups',
+    'com.apple.developer.siri': 'Siri integration',
+    'com.apple.developer.healthkit': 'HealthKit access',
+    'com.apple.developer.game-center': 'Game Center',
+    'com.apple.developer.networking.networkextension': 'Network extensions',
+    'com.apple.developer.networking.vpn.api': 'VPN configuration',
+    'com.apple.developer.devicecheck.appattest-environment': 'App Attest',
+    'com.apple.external-accessory.wireless-configuration': 'Wireless accessory configuration',
+    'com.apple.developer.networking.wifi-info': 'WiFi information access',
+    'com.apple.developer.networking.multipath': 'Multipath networking',
+    'com.apple.developer.associated-domains': 'Associated domains',
+    'com.apple.developer.default-data-protection': 'Data protection',
+    'com.apple.developer.kernel.increased-memory-limit': 'Increased memory limit',
+    'com.apple.developer.kernel.extended-virtual-addressing': 'Extended virtual addressing',
+
+    # Key system entitlements
+    'keychain-access-groups': 'Keychain access groups',
+    'com.apple.developer.team-identifier': 'Team identifier',
+    'get-task-allow': 'Debuggable (get-task-allow)',
+    'com.apple.security.get-task-allow': 'Debuggable (security variant)',
+
+    # iCloud and data sync
+    'com.apple.developer.icloud-container-identifiers': 'iCloud containers',
+    'com.apple.developer.icloud-services': 'iCloud services',
+    'com.apple.developer.ubiquity-kvstore-identifier': 'iCloud key-value storage',
+    'com.apple.developer.ubiquity-container-identifiers': 'iCloud document containers',
+
+    # Networking entitlements
+    'com.apple.developer.networking.HotspotConfiguration': 'Hotspot configuration',
+    'com.apple.developer.networking.slicing': 'Network slicing',
+    'com.apple.developer.networking.custom-protocol': 'Custom network protocols',
+    'com.apple.developer.networking.bluetooth': 'Bluetooth networking',
+
+    # Media and content
+    'com.apple.developer.coremedia.hls.low-latency': 'Low-latency HLS',
+    'com.apple.developer.avfoundation.multitasking-camera-access': 'Background camera access',
+    'com.apple.developer.media-device-discovery-extension': 'Media device discovery',
+
+    # CarPlay entitlements
+    'com.apple.developer.carplay-audio': 'CarPlay audio',
+    'com.apple.developer.carplay-communication': 'CarPlay communication',
+    'com.apple.developer.carplay-messaging': 'CarPlay messaging',
+    'com.apple.developer.carplay-navigation': 'CarPlay navigation',
+    'com.apple.developer.carplay-parking': 'CarPlay parking',
+    'com.apple.developer.carplay-quick-ordering': 'CarPlay quick ordering',
+    'com.apple.developer.carplay-charging': 'CarPlay EV charging',
+    'com.apple.developer.carplay-driving-task': 'CarPlay driving task',
+
+    # Notifications
+    'com.apple.developer.usernotifications.communication': 'Communication notifications',
+    'com.apple.developer.usernotifications.critical-alerts': 'Critical alert notifications',
+    'com.apple.developer.usernotifications.time-sensitive': 'Time sensitive notifications',
+    'aps-environment': 'Push notifications environment',
+
+    # Background processing
+    'com.apple.developer.background-processing': 'Background processing',
+    'com.apple.developer.background-modes': 'Background modes',
+
+    # Security and privacy
+    'com.apple.security.exception.files.absolute-path.read-only': 'Absolute path file read access',
+    'com.apple.security.exception.files.absolute-path.read-write': 'Absolute path file write access',
+    'com.apple.security.exception.files.home-relative-path.read-only': 'Home relative file read access',
+    'com.apple.security.exception.files.home-relative-path.read-write': 'Home relative file write access',
+    'com.apple.security.exception.mach-lookup.global-name': 'Mach service lookup',
+    'com.apple.security.exception.shared-preference.read-only': 'Shared preference read access',
+    'com.apple.security.exception.shared-preference.read-write': 'Shared preference write access',
+    'com.apple.security.temporary-exception.files.absolute-path.read-only': 'Temporary file read access',
+    'com.apple.security.temporary-exception.files.absolute-path.read-write': 'Temporary file write access',
+
+    # Hardware access
+    'com.apple.developer.nfc.readersession.formats': 'NFC reader session',
+    'com.apple.developer.nfc.readersession.iso7816.select-identifiers': 'NFC ISO7816 identifiers',
+    'com.apple.developer.proximity-reader.payment.acceptance': 'Tap to Pay acceptance',
+
+    # App Store and distribution
+    'com.apple.developer.in-app-payments': 'In-app payments',
+    'com.apple.developer.storekit.external-purchase-link': 'External purchase links',
+
+    # System integration
+    'com.apple.developer.weatherkit': 'WeatherKit access',
+    'com.apple.developer.shared-with-you': 'Shared with You',
+    'com.apple.developer.devicecheck.appattest-environment': 'App Attest environment',
+    'com.apple.developer.applesignin': 'Sign in with Apple',
+    'com.apple.developer.group-session': 'SharePlay group sessions',
+    'com.apple.developer.ClassKit-environment': 'ClassKit environment',
+    'com.apple.developer.maps': 'MapKit',
+
+    # Accessibility
+    'com.apple.developer.web-browser-engine.webcontent': 'Web browser engine',
+    'com.apple.developer.web-browser-engine.networking': 'Web browser networking',
+    'com.apple.developer.web-browser-engine.rendering': 'Web browser rendering',
+
+    # Developer tools and debugging
+    'com.apple.private.security.no-container': 'No container restriction',
+    'com.apple.private.security.storage.AppDataContainers': 'App data container access',
+    'com.apple.runningboard.primitiveattribute': 'RunningBoard primitive attributes',
+    'com.apple.frontboard.launchapplications': 'Launch applications',
+
+    # Legacy and compatibility
+    'inter-app-audio': 'Inter-App Audio',
+    'application-identifier': 'Application identifier',
+    'beta-reports-active': 'Beta reporting',
+
+    # Extended entitlements (common in jailbreak/sideload apps)
+    'platform-application': 'Platform application',
+    'com.apple.private.skip-library-validation': 'Skip library validation',
+    'com.apple.private.security.no-sandbox': 'No sandbox restriction',
+    'com.apple.springboard.opensensitiveurl': 'Open sensitive URLs',
+    'com.apple.multitasking.systemappassertions': 'System app assertions',
+    'com.apple.backboardd.launchapplications': 'Backboard launch applications',
+    'com.apple.developer.system-extension.install': 'System extension install',
+    'com.apple.developer.driverkit': 'DriverKit access',
+    'com.apple.developer.kernel.extended-virtual-addressing': 'Extended virtual addressing',
+    'com.apple.developer.kernel.increased-memory-limit': 'Increased memory limit'
+}
+ENTITLEMENT_KEYS = frozenset(map(sys.intern, ENTITLEMENT_MAPPINGS))
+
+# Characters outside [\w.-] are replaced with '_' in generated file names;
+# ASCII names go through str.translate, others fall back to the regex
+SAFE_NAME_RE = re.compile(r'[^\w\-_.]')
+SAFE_NAME_TABLE = str.maketrans({chr(i): '_' for i in range(128) if not (chr(i).isalnum() or chr(i) in '-_.')})
+
+# App name tokens that imply a minimum iOS version, e.g. "ChatGPTw15", in order of precedence
+OS_VERSION_BY_TOKEN = {'ios15': '15.0', 'w15': '15.0', 'ios16': '16.0', 'ios14': '14.0'}
+OS_VERSION_RE = re.compile('|'.join(OS_VERSION_BY_TOKEN))
+
+@functools.lru_cache(maxsize=4096)
+def infer_min_os_version(app_name_lower: str) -> Optional[str]:
+    """Infer the minimum iOS version from an app name token, or None if the name has none"""
+    # Collect every token in one scan, then pick by precedence rather than position in the name
+    tokens = set(OS_VERSION_RE.findall(app_name_lower))
+    for token, os_version in OS_VERSION_BY_TOKEN.items():
+        if token in tokens:
+            return os_version
+    return None
+
+def intern_string(value: Any) -> Any:
+    """Intern str values that repeat across apps so they share one object; other values pass through"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+def load_json(path: str) -> Any:
+    """Load a JSON file, using orjson when it is installed"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def dump_json(data: Any, path: str):
+    """Write data as indented UTF-8 JSON, using orjson when it is installed"""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+def load_plist(data: bytes) -> Any:
+    """Parse plist bytes, picking the binary or XML reader from the leading magic"""
+    if data[:8] == b'bplist00':
+        return plistlib.loads(data, fmt=plistlib.FMT_BINARY)
+    
+    head = data[:64].lstrip(b'\xef\xbb\xbf \t\r\n')
+    if head.startswith((b'<?xml', b'<!DOCTYPE', b'<plist')):
+        return plistlib.loads(data, fmt=plistlib.FMT_XML)
+    
+    raise ValueError('not a plist')
 
 class AltStoreConverter:
-    def __init__(self):
-        self.permission_mappings = {
-            # Privacy descriptions that commonly appear in Info.plist
-            'NSCameraUsageDescription': 'Camera access',
-            'NSMicrophoneUsageDescription': 'Microphone access',
-            'NSPhotoLibraryUsageDescription': 'Photo Library access',
-            'NSPhotoLibraryAddUsageDescription': 'Photo Library write access',
-            'NSLocationWhenInUseUsageDescription': 'Location access when in use',
-            'NSLocationAlwaysAndWhenInUseUsageDescription': 'Location access always',
-            'NSContactsUsageDescription': 'Contacts access',
-            'NSCalendarsUsageDescription': 'Calendar access',
-            'NSRemindersUsageDescription': 'Reminders access',
-            'NSMotionUsageDescription': 'Motion and fitness access',
-            'NSHealthUpdateUsageDescription': 'Health data write access',
-            'NSHealthShareUsageDescription': 'Health data read access',
-            'NSBluetoothAlwaysUsageDescription': 'Bluetooth access',
-            'NSBluetoothPeripheralUsageDescription': 'Bluetooth peripheral access',
-            'NSLocalNetworkUsageDescription': 'Local network access',
-            'NSSpeechRecognitionUsageDescription': 'Speech recognition access',
-            'NSFaceIDUsageDescription': 'Face ID access',
-            'NSAppleMusicUsageDescription': 'Apple Music access',
-            'NSMediaLibraryUsageDescription': 'Media library access',
-            'NSNearbyInteractionUsageDescription': 'Nearby interaction access'
-        }
+    def __init__(self, cache_path: str = '.ipa_cache.json', max_workers: int = 8):
+        # Number of IPAs downloaded and analyzed in parallel
+        self.max_workers = max_workers
+        # One requests.Session per worker thread for connection reuse
+        self._thread_local = threading.local()
+        # Analysis results keyed by download URL + ETag, persisted between runs and loaded on first use
+        self.cache_path = cache_path
+        self._ipa_cache = None
+        self._ipa_cache_lock = threading.Lock()
+        # Analysis results keyed by (download URL, privacy_only), for duplicate URLs within a run
+        self._analyzed_urls = {}
+
+    def get_session(self) -> requests.Session:
+        """Return the calling thread's HTTP session, creating it on first use"""
+        session = getattr(self._thread_local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(REQUEST_HEADERS)
+            # Keep-alive connection pool per host, retrying transient gateway errors
+            adapter = HTTPAdapter(
+                pool_connections=16,
+                pool_maxsize=16,
+                max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+            )
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            self._thread_local.session = session
+        return session
+
+    def load_ipa_cache(self) -> Dict[str, Any]:
+        """Load the persistent IPA analysis cache, starting empty if it is missing or unreadable"""
+        if not os.path.exists(self.cache_path):
+            return {}
         
-        self.entitlement_mappings = {
-            # Core iOS entitlements
-            'com.apple.security.application-groups': 'Application groups',
-            'com.apple.developer.siri': 'Siri integration',
-            'com.apple.developer.healthkit': 'HealthKit access',
-            'com.apple.developer.game-center': 'Game Center',
-            'com.apple.developer.networking.networkextension': 'Network extensions',
-            'com.apple.developer.networking.vpn.api': 'VPN configuration',
-            'com.apple.developer.devicecheck.appattest-environment': 'App Attest',
-            'com.apple.external-accessory.wireless-configuration': 'Wireless accessory configuration',
-            'com.apple.developer.networking.wifi-info': 'WiFi information access',
-            'com.apple.developer.networking.multipath': 'Multipath networking',
-            'com.apple.developer.associated-domains': 'Associated domains',
-            'com.apple.developer.default-data-protection': 'Data protection',
-            'com.apple.developer.kernel.increased-memory-limit': 'Increased memory limit',
-            'com.apple.developer.kernel.extended-virtual-addressing': 'Extended virtual addressing',
-            
-            # Key system entitlements
-            'keychain-access-groups': 'Keychain access groups',
-            'com.apple.developer.team-identifier': 'Team identifier',
-            'get-task-allow': 'Debuggable (get-task-allow)',
-            'com.apple.security.get-task-allow': 'Debuggable (security variant)',
-            
-            # iCloud and data sync
-            'com.apple.developer.icloud-container-identifiers': 'iCloud containers',
-            'com.apple.developer.icloud-services': 'iCloud services',
-            'com.apple.developer.ubiquity-kvstore-identifier': 'iCloud key-value storage',
-            'com.apple.developer.ubiquity-container-identifiers': 'iCloud document containers',
-            
-            # Networking entitlements
-            'com.apple.developer.networking.HotspotConfiguration': 'Hotspot configuration',
-            'com.apple.developer.networking.slicing': 'Network slicing',
-            'com.apple.developer.networking.custom-protocol': 'Custom network protocols',
-            'com.apple.developer.networking.bluetooth': 'Bluetooth networking',
-            
-            # Media and content
-            'com.apple.developer.coremedia.hls.low-latency': 'Low-latency HLS',
-            'com.apple.developer.avfoundation.multitasking-camera-access': 'Background camera access',
-            'com.apple.developer.media-device-discovery-extension': 'Media device discovery',
-            
-            # CarPlay entitlements
-            'com.apple.developer.carplay-audio': 'CarPlay audio',
-            'com.apple.developer.carplay-communication': 'CarPlay communication',
-            'com.apple.developer.carplay-messaging': 'CarPlay messaging',
-            'com.apple.developer.carplay-navigation': 'CarPlay navigation',
-            'com.apple.developer.carplay-parking': 'CarPlay parking',
-            'com.apple.developer.carplay-quick-ordering': 'CarPlay quick ordering',
-            'com.apple.developer.carplay-charging': 'CarPlay EV charging',
-            'com.apple.developer.carplay-driving-task': 'CarPlay driving task',
-            
-            # Notifications
-            'com.apple.developer.usernotifications.communication': 'Communication notifications',
-            'com.apple.developer.usernotifications.critical-alerts': 'Critical alert notifications',
-            'com.apple.developer.usernotifications.time-sensitive': 'Time sensitive notifications',
-            'aps-environment': 'Push notifications environment',
-            
-            # Background processing
-            'com.apple.developer.background-processing': 'Background processing',
-            'com.apple.developer.background-modes': 'Background modes',
-            
-            # Security and privacy
-            'com.apple.security.exception.files.absolute-path.read-only': 'Absolute path file read access',
-            'com.apple.security.exception.files.absolute-path.read-write': 'Absolute path file write access',
-            'com.apple.security.exception.files.home-relative-path.read-only': 'Home relative file read access',
-            'com.apple.security.exception.files.home-relative-path.read-write': 'Home relative file write access',
-            'com.apple.security.exception.mach-lookup.global-name': 'Mach service lookup',
-            'com.apple.security.exception.shared-preference.read-only': 'Shared preference read access',
-            'com.apple.security.exception.shared-preference.read-write': 'Shared preference write access',
-            'com.apple.security.temporary-exception.files.absolute-path.read-only': 'Temporary file read access',
-            'com.apple.security.temporary-exception.files.absolute-path.read-write': 'Temporary file write access',
-            
-            # Hardware access
-            'com.apple.developer.nfc.readersession.formats': 'NFC reader session',
-            'com.apple.developer.nfc.readersession.iso7816.select-identifiers': 'NFC ISO7816 identifiers',
-            'com.apple.developer.proximity-reader.payment.acceptance': 'Tap to Pay acceptance',
-            
-            # App Store and distribution
-            'com.apple.developer.in-app-payments': 'In-app payments',
-            'com.apple.developer.storekit.external-purchase-link': 'External purchase links',
-            
-            # System integration
-            'com.apple.developer.weatherkit': 'WeatherKit access',
-            'com.apple.developer.shared-with-you': 'Shared with You',
-            'com.apple.developer.devicecheck.appattest-environment': 'App Attest environment',
-            'com.apple.developer.applesignin': 'Sign in with Apple',
-            'com.apple.developer.group-session': 'SharePlay group sessions',
-            'com.apple.developer.ClassKit-environment': 'ClassKit environment',
-            'com.apple.developer.maps': 'MapKit',
-            
-            # Accessibility
-            'com.apple.developer.web-browser-engine.webcontent': 'Web browser engine',
-            'com.apple.developer.web-browser-engine.networking': 'Web browser networking',
-            'com.apple.developer.web-browser-engine.rendering': 'Web browser rendering',
-            
-            # Developer tools and debugging
-            'com.apple.private.security.no-container': 'No container restriction',
-            'com.apple.private.security.storage.AppDataContainers': 'App data container access',
-            'com.apple.runningboard.primitiveattribute': 'RunningBoard primitive attributes',
-            'com.apple.frontboard.launchapplications': 'Launch applications',
-            
-            # Legacy and compatibility
-            'inter-app-audio': 'Inter-App Audio',
-            'application-identifier': 'Application identifier',
-            'beta-reports-active': 'Beta reporting',
+        try:
+            return load_json(self.cache_path)
+        except (OSError, ValueError) as e:
+            log.warning("⚠️  Ignoring unreadable IPA cache %s: %s", self.cache_path, e)
+            return {}
+
+    def get_ipa_cache(self) -> Dict[str, Any]:
+        """Return the IPA analysis cache, loading it from disk the first time it is needed"""
+        if self._ipa_cache is None:
+            with self._ipa_cache_lock:
+                if self._ipa_cache is None:
+                    self._ipa_cache = self.load_ipa_cache()
+        return self._ipa_cache
+
+    def save_ipa_cache(self):
+        """Write the IPA analysis cache back to disk, if it was used"""
+        if self._ipa_cache is None:
+            return
+        
+        temp_path = f"{self.cache_path}.tmp"
+        try:
+            dump_json(self._ipa_cache, temp_path)
+            os.replace(temp_path, self.cache_path)
+        except OSError as e:
+            log.warning("⚠️  Could not save IPA cache %s: %s", self.cache_path, e)
+
+    def get_ipa_headers(self, download_url: str) -> Optional[Mapping[str, str]]:
+        """Fetch the IPA's response headers with a HEAD request, or None if it fails"""
+        try:
+            response = self.get_session().head(download_url, allow_redirects=True, timeout=10)
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            log.warning("⚠️  Could not check %s for changes: %s", download_url, e)
+            return None
+        
+        return response.headers
+
+    def get_ipa_cache_key(self, download_url: str, headers: Optional[Mapping[str, str]],
+                          privacy_only: bool = False) -> Optional[str]:
+        """Build a cache key for an IPA from its headers, or None if the server gives no validator"""
+        if headers is None:
+            return None
+        
+        validator = headers.get('ETag') or headers.get('Content-Length')
+        if not validator:
+            return None
+        
+        cache_key = f"{download_url}|{validator}"
+        return f"{cache_key}|privacy" if privacy_only else cache_key
+
+    def remember_analysis(self, download_url: str, privacy_only: bool, cache_key: Optional[str],
+                          permissions: Dict[str, Any]):
+        """Record a successful analysis for reuse within this run and, if possible, across runs"""
+        self._analyzed_urls[(download_url, privacy_only)] = permissions
+        if cache_key:
+            self.get_ipa_cache()[cache_key] = permissions
+
+    def fetch_range(self, download_url: str, byte_range: str) -> Optional[Tuple[bytes, int]]:
+        """Fetch a byte range, returning the data and total file size, or None if ranges are not honoured"""
+        with self.get_session().get(download_url, headers={'Range': byte_range}, stream=True, timeout=30) as response:
+            # A 200 means the server ignored the Range header; don't pull the whole body
+            if response.status_code != 206:
+                return None
+            total_size = response.headers.get('Content-Range', '').rpartition('/')[2]
+            if not total_size.isdigit():
+                return None
+            return response.content, int(total_size)
+
+    def fetch_zip_member_ranged(self, download_url: str, member_name: str) -> Optional[bytes]:
+        """Fetch one file of the top-level app bundle from a remote IPA using HTTP Range requests
+        
+        Reads the zip's end of central directory and central directory from the
+        tail of the file, then only the member's own bytes. Returns None when
+        that isn't possible (no range support, ZIP64, encryption, unknown
+        compression) so the caller can fall back to a full download.
+        """
+        tail = self.fetch_range(download_url, f"bytes=-{ZIP_TAIL_SIZE}")
+        if tail is None:
+            return None
+        tail_data, total_size = tail
+        tail_start = total_size - len(tail_data)
+        
+        # End of central directory record
+        eocd_offset = tail_data.rfind(b'PK\x05\x06')
+        if eocd_offset == -1 or len(tail_data) - eocd_offset < 22:
+            return None
+        entry_count, cd_size, cd_offset = struct.unpack_from('<HII', tail_data, eocd_offset + 10)
+        if entry_count == 0xFFFF or cd_offset == 0xFFFFFFFF:
+            return None  # ZIP64
+        
+        if cd_offset >= tail_start:
+            central_directory = tail_data[cd_offset - tail_start:cd_offset - tail_start + cd_size]
+        else:
+            fetched = self.fetch_range(download_url, f"bytes={cd_offset}-{cd_offset + cd_size - 1}")
+            if fetched is None:
+                return None
+            central_directory = fetched[0]
+        
+        # Find the member in the central directory
+        position = 0
+        for _ in range(entry_count):
+            (signature, flags, method, compressed_size, name_length, extra_length,
+             comment_length, local_offset) = struct.unpack_from(ZIP_CENTRAL_DIRECTORY_ENTRY, central_directory, position)
+            if signature != b'PK\x01\x02':
+                return None
+            name_bytes = central_directory[position + 46:position + 46 + name_length]
+            position += 46 + name_length + extra_length + comment_length
             
-            # Extended entitlements (common in jailbreak/sideload apps)
-            'platform-application': 'Platform application',
-            'com.apple.private.skip-library-validation': 'Skip library validation',
-            'com.apple.private.security.no-sandbox': 'No sandbox restriction',
-            'com.apple.springboard.opensensitiveurl': 'Open sensitive URLs',
-            'com.apple.multitasking.systemappassertions': 'System app assertions',
-            'com.apple.backboardd.launchapplications': 'Backboard launch applications',
-            'com.apple.developer.system-extension.install': 'System extension install',
-            'com.apple.developer.driverkit': 'DriverKit access',
-            'com.apple.developer.kernel.extended-virtual-addressing': 'Extended virtual addressing',
-            'com.apple.developer.kernel.increased-memory-limit': 'Increased memory limit'
-        }
+            name = name_bytes.decode('utf-8' if flags & 0x800 else 'cp437')
+            if not name.startswith('Payload/'):
+                continue
+            bundle_end = name.find('.app/', 8)
+            if bundle_end != -1 and '/' not in name[8:bundle_end] and name[bundle_end + 5:] == member_name:
+                break
+        else:
+            return None
+        
+        if flags & 0x1 or method not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+            return None
+        
+        # The local header's extra field may differ in length from the central one, so leave some slack
+        fetch_end = local_offset + 30 + name_length + extra_length + compressed_size + 1024
+        fetched = self.fetch_range(download_url, f"bytes={local_offset}-{min(fetch_end, total_size) - 1}")
+        if fetched is None:
+            return None
+        local_data = fetched[0]
+        if local_data[:4] != b'PK\x03\x04':
+            return None
+        local_name_length, local_extra_length = struct.unpack_from('<HH', local_data, 26)
+        data_start = 30 + local_name_length + local_extra_length
+        compressed = local_data[data_start:data_start + compressed_size]
+        if len(compressed) < compressed_size:
+            return None
+        
+        if method == zipfile.ZIP_DEFLATED:
+            return zlib.decompress(compressed, -zlib.MAX_WBITS)
+        return compressed
 
-    def download_and_analyze_ipa(self, download_url: str) -> Dict[str, Any]:
-        """Download IPA and extract app permissions from Info.plist and entitlements"""
-        print(f"\n🔍 Analyzing IPA: {download_url}")
+    def analyze_info_plist_ranged(self, download_url: str) -> Optional[Dict[str, Any]]:
+        """Extract privacy permissions by fetching only Info.plist, or None if a full download is needed"""
+        try:
+            plist_bytes = self.fetch_zip_member_ranged(download_url, 'Info.plist')
+            if plist_bytes is None:
+                return None
+            plist_data = load_plist(plist_bytes)
+        except Exception as e:
+            log.debug("Ranged Info.plist read failed for %s: %s", download_url, e)
+            return None
+        
+        log.debug("Read Info.plist from %s with range requests", download_url)
+        return {'entitlements': [], 'privacy': self.extract_privacy_permissions(plist_data, download_url)}
+
+    def download_and_analyze_ipa(self, download_url: str, privacy_only: bool = False) -> Dict[str, Any]:
+        """Download IPA and extract app permissions from Info.plist and entitlements
+        
+        With privacy_only, only Info.plist is needed, so it is fetched with HTTP
+        Range requests when the server supports them instead of downloading the IPA.
+        """
+        log.debug("🔍 Analyzing IPA: %s", download_url)
         
-        temp_path = None
+        # Same IPA already analyzed earlier in this run
+        if (download_url, privacy_only) in self._analyzed_urls:
+            log.debug("♻️  Already analyzed in this run, reusing result for %s", download_url)
+            return self._analyzed_urls[(download_url, privacy_only)]
+        
+        # Unchanged since a previous run
+        headers = self.get_ipa_headers(download_url)
+        cache_key = self.get_ipa_cache_key(download_url, headers, privacy_only)
+        ipa_cache = self.get_ipa_cache()
+        if cache_key and cache_key in ipa_cache:
+            log.info("♻️  IPA unchanged since last analysis, using cached result for %s", download_url)
+            permissions = ipa_cache[cache_key]
+            self._analyzed_urls[(download_url, privacy_only)] = permissions
+            return permissions
+        
+        if privacy_only and headers is not None and headers.get('Accept-Ranges', '').lower() == 'bytes':
+            permissions = self.analyze_info_plist_ranged(download_url)
+            if permissions is not None:
+                self.remember_analysis(download_url, privacy_only, cache_key, permissions)
+                return permissions
+            log.debug("Falling back to a full download of %s", download_url)
+        
+        response = None
+        ipa_buffer = None
         try:
-            # Download IPA to temporary file with better error handling
-            print("  📥 Downloading IPA...")
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (iPhone; CPU iPhone OS 16_0 like Mac OS X) AppleWebKit/605.1.15'
-            }
-            response = requests.get(download_url, stream=True, timeout=60, headers=headers)
+            # Download IPA with better error handling
+            log.debug("📥 Downloading %s", download_url)
+            response = self.get_session().get(download_url, stream=True, timeout=60)
             response.raise_for_status()
             
             # Check if we actually got an IPA file
             content_type = response.headers.get('content-type', '')
             if 'application/octet-stream' not in content_type and 'application/zip' not in content_type:
-                print(f"  ⚠️  Warning: Unexpected content type: {content_type}")
+                log.warning("⚠️  Unexpected content type for %s: %s", download_url, content_type)
             
-            # Create temp file
-            with tempfile.NamedTemporaryFile(suffix='.ipa', delete=False) as temp_file:
-                temp_path = temp_file.name
-                file_size = 0
-                for chunk in response.iter_content(chunk_size=8192):
-                    temp_file.write(chunk)
-                    file_size += len(chunk)
+            # Keep the IPA in memory, only spilling to disk for very large downloads
+            content_length = response.headers.get('Content-Length', '')
+            content_encoding = response.headers.get('Content-Encoding', 'identity')
+            if content_length.isdigit() and int(content_length) <= IPA_SPOOL_MAX_SIZE and content_encoding == 'identity':
+                file_size = int(content_length)
+                ipa_buffer = self.read_response_into_buffer(response, file_size)
+            else:
+                ipa_buffer, file_size = self.spool_response(response)
             
-            print(f"  ✅ Downloaded {file_size} bytes")
+            log.debug("Downloaded %d bytes from %s", file_size, download_url)
             
             # Verify it's a valid ZIP/IPA file
-            if not zipfile.is_zipfile(temp_path):
-                print("  ❌ Downloaded file is not a valid ZIP/IPA file")
+            ipa_buffer.seek(0)
+            if not zipfile.is_zipfile(ipa_buffer):
+                log.error("❌ Downloaded file is not a valid ZIP/IPA file: %s", download_url)
                 return {'entitlements': [], 'privacy': {}}
             
             # Extract and analyze IPA
-            print("  🔬 Analyzing IPA contents...")
-            permissions = self.analyze_ipa_file(temp_path)
+            log.debug("🔬 Analyzing IPA contents of %s", download_url)
+            ipa_buffer.seek(0)
+            permissions = self.analyze_ipa_file(ipa_buffer, privacy_only, download_url)
             
             total_permissions = len(permissions.get('privacy', {})) + len(permissions.get('entitlements', []))
-            print(f"  ✅ Analysis complete! Found {total_permissions} permissions")
+            log.debug("Analysis complete! Found %d permissions in %s", total_permissions, download_url)
             
+            self.remember_analysis(download_url, privacy_only, cache_key, permissions)
             return permissions
             
         except requests.exceptions.Timeout:
-            print("  ❌ Download timed out")
+            log.error("❌ Download timed out: %s", download_url)
             return {'entitlements': [], 'privacy': {}}
         except requests.exceptions.ConnectionError:
-            print("  ❌ Connection error")
+            log.error("❌ Connection error: %s", download_url)
             return {'entitlements': [], 'privacy': {}}
         except requests.exceptions.HTTPError as e:
-            print(f"  ❌ HTTP error: {e}")
+            log.error("❌ HTTP error: %s", e)
             return {'entitlements': [], 'privacy': {}}
         except Exception as e:
-            print(f"  ❌ Error analyzing IPA {download_url}: {e}")
+            log.error("❌ Error analyzing IPA %s: %s", download_url, e)
             return {'entitlements': [], 'privacy': {}}
         finally:
-            # Always clean up temp file
-            if temp_path and os.path.exists(temp_path):
+            # Release the connection back to the session's pool
+            if response is not None:
+                response.close()
+            if ipa_buffer is not None:
+                ipa_buffer.close()
+
+    def read_response_into_buffer(self, response: requests.Response, size: int) -> io.BytesIO:
+        """Read a response body of known size straight into a preallocated in-memory buffer"""
+        ipa_buffer = io.BytesIO(bytes(size))
+        offset = 0
+        with ipa_buffer.getbuffer() as view:
+            while offset < size:
+                read = response.raw.readinto(view[offset:offset + DOWNLOAD_CHUNK_SIZE])
+                if not read:
+                    break
+                offset += read
+        
+        if offset < size:
+            raise IOError(f"Download truncated after {offset} of {size} bytes")
+        return ipa_buffer
+
+    def spool_response(self, response: requests.Response) -> Tuple[BinaryIO, int]:
+        """Stream a response body of unknown size into memory, moving it to a temp file past IPA_SPOOL_MAX_SIZE"""
+        # tempfile.SpooledTemporaryFile lacks seekable() before Python 3.11, which zipfile needs,
+        # so roll over from a BytesIO to a real TemporaryFile by hand
+        ipa_buffer = io.BytesIO()
+        file_size = 0
+        for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+            if file_size + len(chunk) > IPA_SPOOL_MAX_SIZE and isinstance(ipa_buffer, io.BytesIO):
+                spilled = tempfile.TemporaryFile(suffix='.ipa')
+                spilled.write(ipa_buffer.getbuffer())
+                ipa_buffer.close()
+                ipa_buffer = spilled
+            ipa_buffer.write(chunk)
+            file_size += len(chunk)
+        
+        return ipa_buffer, file_size
+
+    def analyze_ipa_file(self, ipa_file: Union[str, BinaryIO], privacy_only: bool = False,
+                         source: Optional[str] = None) -> Dict[str, Any]:
+        """Extract app permissions from an IPA path or seekable file object by parsing the bundle in-process
+
+        With privacy_only, only Info.plist is read and entitlements are always empty.
+        source names the IPA in log messages, defaulting to its path.
+        Archive and read errors are raised rather than logged, so a partial result is never cached.
+        """
+        # Entitlements are collected in a set and returned as a sorted list
+        permissions = {'entitlements': set(), 'privacy': {}}
+        if source is None:
+            source = ipa_file if isinstance(ipa_file, str) else 'IPA'
+        
+        with zipfile.ZipFile(ipa_file, 'r') as zip_file:
+            # Find the app bundle and its top-level files in a single pass
+            names = zip_file.namelist()
+            app_folder = None
+            bundle_files = set()
+            for name in names:
+                if app_folder is None:
+                    if not name.startswith('Payload/'):
+                        continue
+                    bundle_end = name.find('.app/', 8)
+                    if bundle_end == -1 or '/' in name[8:bundle_end]:
+                        continue
+                    app_folder = name[:bundle_end + 5]
+                
+                if name.startswith(app_folder):
+                    relative_name = name[len(app_folder):]
+                    if relative_name and '/' not in relative_name:
+                        bundle_files.add(relative_name)
+            
+            if app_folder is None:
+                log.warning("No app bundle found in %s", source)
+                return {'entitlements': [], 'privacy': {}}
+            
+            log.debug("Found app bundle: %s", app_folder)
+            
+            # Executable name defaults to the bundle name unless Info.plist says otherwise
+            executable_name = app_folder[len('Payload/'):-len('.app/')]
+            
+            # Extract Info.plist for privacy permissions
+            info_plist_path = f"{app_folder}Info.plist"
+            if 'Info.plist' in bundle_files:
+                log.debug("Extracting Info.plist...")
+                with zip_file.open(info_plist_path) as plist_file:
+                    plist_bytes = plist_file.read()
                 try:
-                    os.unlink(temp_path)
-                    print("  🗑️  Cleaned up temporary file")
+                    plist_data = load_plist(plist_bytes)
+                    executable_name = plist_data.get('CFBundleExecutable') or executable_name
+                    permissions['privacy'] = self.extract_privacy_permissions(plist_data, source)
                 except Exception as e:
-                    print(f"  ⚠️  Warning: Could not delete temp file: {e}")
+                    log.warning("Error reading Info.plist in %s: %s", source, e)
+            else:
+                log.warning("Info.plist not found in %s", source)
+            
+            if privacy_only:
+                permissions['entitlements'] = []
+                return permissions
+            
+            # Read entitlements straight from the main executable's code signature
+            executable_path = f"{app_folder}{executable_name}"
+            if executable_name in bundle_files:
+                log.debug("Parsing code signature of executable: %s", executable_path)
+                with zip_file.open(executable_path) as executable_file:
+                    entitlements_from_binary = self.extract_entitlements_from_binary(executable_file)
+                permissions['entitlements'].update(entitlements_from_binary)
+            else:
+                log.warning("Main executable not found: %s", executable_path)
+            
+            # Also extract from the app's embedded.mobileprovision
+            if 'embedded.mobileprovision' in bundle_files:
+                mobileprovision_path = f"{app_folder}embedded.mobileprovision"
+                log.debug("Decoding mobileprovision: %s", mobileprovision_path)
+                entitlements_from_provision = self.extract_entitlements_from_mobileprovision(
+                    zip_file.read(mobileprovision_path))
+                permissions['entitlements'].update(entitlements_from_provision)
+        
+        permissions['entitlements'] = sorted(permissions['entitlements'])
+        return permissions
 
-    def analyze_ipa_file(self, ipa_path: str) -> Dict[str, Any]:
-        """Extract app permissions from IPA file using proper macOS tools"""
-        permissions = {'entitlements': [], 'privacy': {}}
+    def extract_privacy_permissions(self, plist_data: Dict[str, Any], source: str) -> Dict[str, str]:
+        """Extract privacy usage descriptions from parsed Info.plist data"""
+        privacy = {}
+        permission_keys = PERMISSION_KEYS
+        permission_mappings = PERMISSION_MAPPINGS
         
-        try:
-            with zipfile.ZipFile(ipa_path, 'r') as zip_file:
-                # Find the app bundle
-                app_folders = [name for name in zip_file.namelist() 
-                             if name.startswith('Payload/') and name.endswith('.app/')]
-                
-                if not app_folders:
-                    print("No app bundle found in IPA")
-                    return permissions
-                
-                app_folder = app_folders[0]
-                print(f"Found app bundle: {app_folder}")
-                
-                # Extract Info.plist for privacy permissions
-                info_plist_path = f"{app_folder}Info.plist"
-                if info_plist_path in zip_file.namelist():
-                    print("Extracting Info.plist...")
-                    with zip_file.open(info_plist_path) as plist_file:
-                        try:
-                            plist_data = plistlib.load(plist_file)
-                            
-                            # Extract privacy permissions
-                            privacy_found = 0
-                            for key, description in plist_data.items():
-                                if key in self.permission_mappings:
-                                    # Use app's description if available and not empty, otherwise use default mapping
-                                    if description and isinstance(description, str) and description.strip():
-                                        permissions['privacy'][key] = description
-                                        print(f"  Found privacy permission: {key} (app description)")
-                                    else:
-                                        # Use the default mapping for empty/missing descriptions
-                                        permissions['privacy'][key] = self.permission_mappings[key]
-                                        print(f"  Found privacy permission: {key} (default description)")
-                                    privacy_found += 1
-                            
-                            print(f"  Total privacy permissions found: {privacy_found}")
-                            
-                        except Exception as e:
-                            print(f"Error reading Info.plist: {e}")
+        for key, description in plist_data.items():
+            if key in permission_keys:
+                # Use app's description if available and not empty, otherwise use default mapping
+                if description and isinstance(description, str) and description.strip():
+                    privacy[sys.intern(key)] = description
+                    log.debug("Found privacy permission: %s (app description)", key)
                 else:
-                    print("Info.plist not found in expected location")
-                
-                # Extract the entire app bundle to a temporary directory for codesign analysis
-                with tempfile.TemporaryDirectory() as temp_dir:
-                    # Extract all app bundle files
-                    app_files = [f for f in zip_file.namelist() if f.startswith(app_folder)]
-                    
-                    for file_path in app_files:
-                        if not file_path.endswith('/'):  # Skip directory entries
-                            # Create the directory structure
-                            full_path = os.path.join(temp_dir, file_path)
-                            os.makedirs(os.path.dirname(full_path), exist_ok=True)
-                            
-                            # Extract the file
-                            with zip_file.open(file_path) as source:
-                                with open(full_path, 'wb') as target:
-                                    target.write(source.read())
-                    
-                    # Use codesign to extract entitlements from the app bundle
-                    app_path = os.path.join(temp_dir, app_folder)
-                    print(f"Using codesign on extracted app bundle: {app_path}")
-                    entitlements_from_codesign = self.extract_entitlements_with_codesign(app_path)
-                    permissions['entitlements'].extend(entitlements_from_codesign)
-                    
-                    # Also try to extract from embedded.mobileprovision using security tool
-                    mobileprovision_files = [f for f in zip_file.namelist() if 'embedded.mobileprovision' in f]
-                    if mobileprovision_files:
-                        mobileprovision_path = os.path.join(temp_dir, mobileprovision_files[0])
-                        if os.path.exists(mobileprovision_path):
-                            print(f"Using security tool on mobileprovision: {mobileprovision_path}")
-                            entitlements_from_provision = self.extract_mobileprovision_with_security(mobileprovision_path)
-                            
-                            # Add any new entitlements we haven't seen yet
-                            for ent in entitlements_from_provision:
-                                if ent not in permissions['entitlements']:
-                                    permissions['entitlements'].append(ent)
-                    
-                # Remove duplicates and sort
-                permissions['entitlements'] = sorted(list(set(permissions['entitlements'])))
-                
-        except Exception as e:
-            print(f"Error analyzing IPA file: {e}")
+                    # Use the default mapping for empty/missing descriptions
+                    privacy[sys.intern(key)] = permission_mappings[key]
+                    log.debug("Found privacy permission: %s (default description)", key)
         
-        return permissions
+        log.info("Found %d privacy permissions in %s", len(privacy), source)
+        return privacy
 
-    def extract_entitlements_with_codesign(self, app_bundle_path):
-        """Extract entitlements using codesign tool"""
+    def find_entitlements_blob(self, binary_file: BinaryIO) -> Optional[bytes]:
+        """Locate the embedded entitlements plist inside a thin or FAT Mach-O binary
+        
+        Only seeks forward, so the binary can be read straight out of the IPA's
+        zip stream without buffering the whole executable.
+        """
+        slice_offset = 0
+        
+        # FAT headers are always big-endian; pick the arm64 slice if there is one
+        header = binary_file.read(8)
+        magic, nfat_arch = struct.unpack('>II', header)
+        if magic in (FAT_MAGIC, FAT_MAGIC_64):
+            arch_format = '>iiQQII' if magic == FAT_MAGIC_64 else '>iiIII'
+            arch_size = struct.calcsize(arch_format)
+            arch_table = binary_file.read(nfat_arch * arch_size)
+            slices = []
+            for i in range(nfat_arch):
+                cputype, _, offset = struct.unpack_from(arch_format, arch_table, i * arch_size)[:3]
+                slices.append((cputype, offset))
+            if not slices:
+                return None
+            slice_offset = next((offset for cputype, offset in slices if cputype == CPU_TYPE_ARM64), slices[0][1])
+            binary_file.seek(slice_offset)
+            header = binary_file.read(8)
+        
+        # iOS Mach-O headers and load commands are little-endian
+        magic, = struct.unpack_from('<I', header)
+        if magic == MH_MAGIC_64:
+            header_size = 32
+        elif magic == MH_MAGIC:
+            header_size = 28
+        else:
+            return None
+        
+        header += binary_file.read(header_size - len(header))
+        ncmds, sizeofcmds = struct.unpack_from('<II', header, 16)
+        load_commands = binary_file.read(sizeofcmds)
+        
+        cmd_offset = 0
+        for _ in range(ncmds):
+            cmd, cmdsize = struct.unpack_from('<II', load_commands, cmd_offset)
+            if cmd == LC_CODE_SIGNATURE:
+                dataoff, datasize = struct.unpack_from('<II', load_commands, cmd_offset + 8)
+                binary_file.seek(slice_offset + dataoff)
+                return self.find_entitlements_in_superblob(binary_file.read(datasize))
+            if cmdsize == 0:
+                break
+            cmd_offset += cmdsize
+        
+        return None
+
+    def find_entitlements_in_superblob(self, superblob: bytes) -> Optional[bytes]:
+        """Return the entitlements plist payload from a code signature SuperBlob"""
+        # Code signature structures are big-endian
+        magic, _, count = struct.unpack_from('>III', superblob)
+        if magic != CSMAGIC_EMBEDDED_SIGNATURE:
+            return None
+        
+        for i in range(count):
+            _, blob_offset = struct.unpack_from('>II', superblob, 12 + i * 8)
+            blob_magic, blob_length = struct.unpack_from('>II', superblob, blob_offset)
+            if blob_magic == CSMAGIC_EMBEDDED_ENTITLEMENTS:
+                # Payload after the 8-byte blob header is the entitlements XML plist
+                return superblob[blob_offset + 8:blob_offset + blob_length]
+        
+        return None
+
+    def extract_entitlements_from_binary(self, binary_file: BinaryIO) -> List[str]:
+        """Extract entitlements embedded in the Mach-O code signature"""
         entitlements = []
         
         try:
-            # Use codesign to extract entitlements
-            result = subprocess.run([
-                'codesign', '-d', '--entitlements', ':-', app_bundle_path
-            ], capture_output=True, text=True, timeout=30)
+            entitlements_blob = self.find_entitlements_blob(binary_file)
             
-            if result.returncode == 0 and result.stdout:
-                print("  Using codesign to extract entitlements...")
+            if entitlements_blob:
+                log.debug("Reading entitlements from code signature...")
                 try:
                     # Parse the entitlements plist
-                    entitlements_data = plistlib.loads(result.stdout.encode('utf-8'))
+                    entitlements_data = load_plist(entitlements_blob)
                     
                     entitlements_found = 0
-                    for key in entitlements_data.keys():
-                        if key in self.entitlement_mappings:
-                            entitlements.append(key)
-                            entitlements_found += 1
-                            print(f"  Found entitlement (codesign): {key}")
+                    for key in ENTITLEMENT_KEYS & entitlements_data.keys():
+                        entitlements.append(sys.intern(key))
+                        entitlements_found += 1
+                        log.debug("Found entitlement (code signature): %s", key)
                     
-                    print(f"  Total entitlements found with codesign: {entitlements_found}")
+                    log.debug("Total entitlements found in code signature: %d", entitlements_found)
                     
                 except Exception as parse_e:
-                    print(f"  Could not parse codesign output: {parse_e}")
+                    log.warning("Could not parse entitlements blob: %s", parse_e)
             else:
-                print(f"  codesign failed: {result.stderr}")
+                log.debug("No embedded entitlements found in code signature")
                 
-        except subprocess.TimeoutExpired:
-            print("  codesign timed out")
+        except (OSError, zipfile.BadZipFile, zlib.error):
+            # Failing to read the archive is not a property of the binary, leave it to the caller
+            raise
         except Exception as e:
-            print(f"  Error running codesign: {e}")
+            log.warning("Error parsing Mach-O binary: %s", e)
         
         return entitlements
 
-    def extract_mobileprovision_with_security(self, mobileprovision_path):
-        """Extract entitlements from mobileprovision using security tool"""
+    def extract_entitlements_from_mobileprovision(self, mobileprovision_data: bytes) -> List[str]:
+        """Extract entitlements from the CMS-signed plist in embedded.mobileprovision"""
         entitlements = []
         
         try:
-            # Use security tool to decode the mobileprovision
-            result = subprocess.run([
-                'security', 'cms', '-D', '-i', mobileprovision_path
-            ], capture_output=True, text=True, timeout=30)
+            # The provisioning profile is a DER CMS SignedData wrapping a plist
+            content_info = cms.ContentInfo.load(mobileprovision_data)
+            plist_bytes = content_info['content']['encap_content_info']['content'].native
             
-            if result.returncode == 0 and result.stdout:
-                print("  Using security tool to decode mobileprovision...")
+            if plist_bytes:
+                log.debug("Decoding mobileprovision...")
                 try:
                     # Parse the decoded plist
-                    plist_data = plistlib.loads(result.stdout.encode('utf-8'))
+                    plist_data = load_plist(plist_bytes)
                     
                     if 'Entitlements' in plist_data:
                         entitlements_dict = plist_data['Entitlements']
                         entitlements_found = 0
                         
-                        for key in entitlements_dict.keys():
-                            if key in self.entitlement_mappings:
-                                entitlements.append(key)
-                                entitlements_found += 1
-                                print(f"  Found entitlement (security): {key}")
+                        for key in ENTITLEMENT_KEYS & entitlements_dict.keys():
+                            entitlements.append(sys.intern(key))
+                            entitlements_found += 1
+                            log.debug("Found entitlement (mobileprovision): %s", key)
                         
-                        print(f"  Total entitlements found with security tool: {entitlements_found}")
+                        log.debug("Total entitlements found in mobileprovision: %d", entitlements_found)
                     else:
-                        print("  No 'Entitlements' key found in mobileprovision")
+                        log.debug("No 'Entitlements' key found in mobileprovision")
                         
                 except Exception as parse_e:
-                    print(f"  Could not parse security tool output: {parse_e}")
+                    log.warning("Could not parse mobileprovision plist: %s", parse_e)
             else:
-                print(f"  security tool failed: {result.stderr}")
+                log.debug("mobileprovision has no signed content")
                 
-        except subprocess.TimeoutExpired:
-            print("  security tool timed out")
         except Exception as e:
-            print(f"  Error running security tool: {e}")
+            log.warning("Error decoding mobileprovision: %s", e)
         
         return entitlements
 
@@ -414,14 +825,15 @@ class AltStoreConverter:
         # Only generate as absolute fallback if no existing screenshots
         # Most apps should already have screenshots in the source data
         if base_url:
-            safe_name = re.sub(r'[^\w\-_.]', '_', app_name)
+            safe_name = app_name.translate(SAFE_NAME_TABLE) if app_name.isascii() else SAFE_NAME_RE.sub('_', app_name)
             # Just try one screenshot as fallback
             screenshot_url = f"{base_url}/serve/screenshots/{app_name}/{safe_name}-0.png"
             screenshots.append(screenshot_url)
         
         return screenshots
 
-    def convert_app_to_altstore_format(self, app: Dict[str, Any], analyze_ipa: bool = False) -> Dict[str, Any]:
+    def convert_app_to_altstore_format(self, app: Dict[str, Any], analyze_ipa: bool = False,
+                                       privacy_only: bool = False) -> Dict[str, Any]:
         """Convert a single app from CyPwn format to AltStore format"""
         
         # Skip empty apps
@@ -431,11 +843,11 @@ class AltStoreConverter:
         # Create base app structure - preserve all existing fields where appropriate
         altstore_app = {
             'name': app.get('name', ''),
-            'bundleIdentifier': app.get('bundleIdentifier', ''),
-            'developerName': app.get('developerName', ''),
+            'bundleIdentifier': intern_string(app.get('bundleIdentifier', '')),
+            'developerName': intern_string(app.get('developerName', '')),
             'localizedDescription': app.get('localizedDescription', ''),
             'iconURL': app.get('iconURL', ''),
-            'tintColor': app.get('tintColor', 'FFC300')
+            'tintColor': intern_string(app.get('tintColor', 'FFC300'))
         }
         
         # Add subtitle if it exists
@@ -470,73 +882,146 @@ class AltStoreConverter:
             
             # Add intelligent minimum OS version based on app name
             app_name_lower = app.get('name', '').lower()
-            if 'ios15' in app_name_lower or 'w15' in app_name_lower:
-                version_data['minOSVersion'] = '15.0'
-            elif 'ios16' in app_name_lower:
-                version_data['minOSVersion'] = '16.0'
-            elif 'ios14' in app_name_lower:
-                version_data['minOSVersion'] = '14.0'
-            elif 'minOSVersion' in app:
-                version_data['minOSVersion'] = app['minOSVersion']
-            else:
-                version_data['minOSVersion'] = '13.0'  # Safe default
+            version_data['minOSVersion'] = infer_min_os_version(app_name_lower) or app.get('minOSVersion', '13.0')  # Safe default
             
             altstore_app['versions'] = [version_data]
         else:
             altstore_app['versions'] = app['versions']
         
-        # Analyze IPA for permissions if requested
-        if analyze_ipa and altstore_app['versions']:
-            download_url = altstore_app['versions'][0].get('downloadURL')
-            if download_url:
-                permissions = self.download_and_analyze_ipa(download_url)
-                if permissions and (permissions.get('entitlements') or permissions.get('privacy')):
-                    # Clean up empty arrays/dicts
-                    clean_permissions = {}
-                    if permissions.get('entitlements'):
-                        clean_permissions['entitlements'] = permissions['entitlements']
-                    if permissions.get('privacy'):
-                        clean_permissions['privacy'] = permissions['privacy']
-                    
-                    if clean_permissions:
-                        altstore_app['appPermissions'] = clean_permissions
+        # Analyze IPA for permissions if requested, unless the source already has them for this version
+        if analyze_ipa:
+            download_url = self.get_download_url(altstore_app)
+            if download_url and not self.reuse_prior_permissions(app, altstore_app, privacy_only):
+                self.apply_app_permissions(altstore_app, self.download_and_analyze_ipa(download_url, privacy_only))
+                self.record_permissions_source(altstore_app, privacy_only)
         
         return altstore_app
 
-    def convert_repository(self, input_file: str, output_file: str, analyze_ipas: bool = False):
+    def get_permissions_source_key(self, altstore_app: Dict[str, Any], privacy_only: bool) -> Optional[str]:
+        """Cache key recording that permissions were computed for the app's current version and download URL"""
+        download_url = self.get_download_url(altstore_app)
+        if not download_url:
+            return None
+        
+        source_key = f"{download_url}|{altstore_app['versions'][0].get('version')}|source"
+        return f"{source_key}|privacy" if privacy_only else source_key
+
+    def reuse_prior_permissions(self, app: Dict[str, Any], altstore_app: Dict[str, Any], privacy_only: bool) -> bool:
+        """Carry over the source app's appPermissions if they were computed for its current version and download
+
+        Returns True if the permissions were reused, False if the IPA still needs analyzing.
+        """
+        prior_permissions = app.get('appPermissions')
+        source_key = self.get_permissions_source_key(altstore_app, privacy_only)
+        if not prior_permissions or not source_key:
+            return False
+        
+        # Only trust permissions this converter recorded for the same version, URL and analysis mode
+        if not self.get_ipa_cache().get(source_key):
+            return False
+        
+        self.apply_app_permissions(altstore_app, prior_permissions)
+        return True
+
+    def record_permissions_source(self, altstore_app: Dict[str, Any], privacy_only: bool):
+        """Remember which version the app's permissions were computed for, if its IPA was analyzed successfully"""
+        download_url = self.get_download_url(altstore_app)
+        if download_url and (download_url, privacy_only) in self._analyzed_urls:
+            self.get_ipa_cache()[self.get_permissions_source_key(altstore_app, privacy_only)] = True
+
+    def get_download_url(self, altstore_app: Dict[str, Any]) -> Optional[str]:
+        """Return the download URL of the app's latest version, if any"""
+        if altstore_app['versions'] and isinstance(altstore_app['versions'][0], dict):
+            return altstore_app['versions'][0].get('downloadURL')
+        return None
+
+    def apply_app_permissions(self, altstore_app: Dict[str, Any], permissions: Dict[str, Any]):
+        """Attach IPA analysis results to a converted app, leaving out empty sections"""
+        if permissions and (permissions.get('entitlements') or permissions.get('privacy')):
+            # Clean up empty arrays/dicts
+            clean_permissions = {}
+            if permissions.get('entitlements'):
+                clean_permissions['entitlements'] = permissions['entitlements']
+            if permissions.get('privacy'):
+                clean_permissions['privacy'] = permissions['privacy']
+            
+            if clean_permissions:
+                altstore_app['appPermissions'] = clean_permissions
+
+    def analyze_apps(self, apps_by_url: Dict[str, List[Dict[str, Any]]], privacy_only: bool = False):
+        """Download and analyze IPAs concurrently, attaching permissions to every app sharing a URL"""
+        print(f"\n🔍 Analyzing {len(apps_by_url)} IPAs with up to {self.max_workers} parallel downloads...")
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(self.download_and_analyze_ipa, url, privacy_only): url for url in apps_by_url}
+            
+            for done, future in enumerate(as_completed(futures), 1):
+                download_url = futures[future]
+                apps = apps_by_url[download_url]
+                app_names = ', '.join(app['name'] for app in apps)
+                try:
+                    permissions = future.result()
+                except Exception as e:
+                    print(f"❌ [{done}/{len(futures)}] Error analyzing {app_names}: {e}")
+                    continue
+                
+                for app in apps:
+                    self.apply_app_permissions(app, permissions)
+                    self.record_permissions_source(app, privacy_only)
+                print(f"✅ [{done}/{len(futures)}] Analyzed: {app_names}")
+
+    def convert_repository(self, input_file: str, output_file: str, analyze_ipas: bool = False,
+                           privacy_only: bool = False):
         """Convert entire repository from CyPwn format to AltStore format"""
         
         print(f"🚀 Converting {input_file} to AltStore format...")
-        if analyze_ipas:
+        if analyze_ipas and privacy_only:
+            print("🔍 Privacy-only IPA analysis enabled - Info.plist will be read from each app!")
+        elif analyze_ipas:
             print("🔍 IPA analysis enabled - this will download and analyze each app!")
         
-        with open(input_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_json(input_file)
         
-        # Convert apps
+        # Convert apps; IPA analysis is collected per download URL and run afterwards
         converted_apps = []
+        apps_by_url = {}
+        reused_permissions = 0
         skipped_apps = 0
         total_apps = len(data.get('apps', []))
         
         for i, app in enumerate(data.get('apps', []), 1):
             app_name = app.get('name', 'Unknown')
-            print(f"\n{'='*60}")
-            print(f"Processing app {i}/{total_apps}: {app_name}")
-            print(f"{'='*60}")
             
             try:
-                converted_app = self.convert_app_to_altstore_format(app, analyze_ipa=analyze_ipas)
+                converted_app = self.convert_app_to_altstore_format(app)
                 if converted_app:
                     converted_apps.append(converted_app)
-                    print(f"✅ Successfully converted: {app_name}")
+                    print(f"✅ [{i}/{total_apps}] Converted: {app_name}")
+                    
+                    if analyze_ipas:
+                        download_url = self.get_download_url(converted_app)
+                        if download_url and self.reuse_prior_permissions(app, converted_app, privacy_only):
+                            reused_permissions += 1
+                        elif download_url:
+                            apps_by_url.setdefault(download_url, []).append(converted_app)
                 else:
                     skipped_apps += 1
-                    print(f"⚠️  Skipped incomplete app: {app_name}")
+                    print(f"⚠️  [{i}/{total_apps}] Skipped incomplete app: {app_name}")
             except Exception as e:
                 skipped_apps += 1
-                print(f"❌ Error converting app {app_name}: {e}")
+                print(f"❌ [{i}/{total_apps}] Error converting app {app_name}: {e}")
                 continue
         
+        if reused_permissions:
+            print(f"\n♻️  Kept existing permissions for {reused_permissions} apps whose version is unchanged")
+        
+        if apps_by_url:
+            try:
+                self.analyze_apps(apps_by_url, privacy_only)
+            finally:
+                # Keep whatever was analyzed, even if the run is interrupted
+                self.save_ipa_cache()
+        
         # Update the data structure
         data['apps'] = converted_apps
         
@@ -548,8 +1033,7 @@ class AltStoreConverter:
             data['sourceURL'] = f"https://example.com/{os.path.basename(output_file)}"
         
         # Write converted data
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        dump_json(data, output_file)
         
         print(f"\n{'='*60}")
         print(f"🎉 CONVERSION COMPLETE!")
@@ -558,7 +1042,14 @@ class AltStoreConverter:
         print(f"📄 Output saved to: {output_file}")
         print(f"{'='*60}")
 
-    def batch_convert(self, input_directory: str, output_directory: str, analyze_ipas: bool = False):
+    def print_batch_banner(self, json_file: str):
+        """Print the header that precedes each file's output in batch mode"""
+        print(f"\n{'='*50}")
+        print(f"Converting {json_file}")
+        print(f"{'='*50}")
+
+    def batch_convert(self, input_directory: str, output_directory: str, analyze_ipas: bool = False,
+                      privacy_only: bool = False):
         """Batch convert all JSON files in a directory"""
         
         if not os.path.exists(output_directory):
@@ -566,31 +1057,58 @@ class AltStoreConverter:
         
         json_files = [f for f in os.listdir(input_directory) if f.endswith('.json')]
         
+        # Without IPA analysis each file is pure CPU work, so convert them in parallel processes
+        if not analyze_ipas and len(json_files) > 1:
+            jobs = [(os.path.join(input_directory, json_file), os.path.join(output_directory, f"converted_{json_file}"))
+                    for json_file in json_files]
+            with multiprocessing.Pool(min(os.cpu_count() or 1, len(jobs))) as pool:
+                # Workers return their output instead of printing it, so each file's report stays in one piece
+                for json_file, worker_output in zip(json_files, pool.imap(convert_repository_worker, jobs)):
+                    self.print_batch_banner(json_file)
+                    print(worker_output, end='')
+            return
+        
         for json_file in json_files:
             input_path = os.path.join(input_directory, json_file)
             output_path = os.path.join(output_directory, f"converted_{json_file}")
             
-            print(f"\n{'='*50}")
-            print(f"Converting {json_file}")
-            print(f"{'='*50}")
+            self.print_batch_banner(json_file)
             
             try:
-                self.convert_repository(input_path, output_path, analyze_ipas)
+                self.convert_repository(input_path, output_path, analyze_ipas, privacy_only)
             except Exception as e:
                 print(f"Error converting {json_file}: {e}")
 
+def convert_repository_worker(paths: Tuple[str, str]) -> str:
+    """Convert a single repository without IPA analysis in a batch_convert worker process, returning its output"""
+    input_path, output_path = paths
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        try:
+            AltStoreConverter().convert_repository(input_path, output_path)
+        except Exception as e:
+            print(f"Error converting {os.path.basename(input_path)}: {e}")
+    return output.getvalue()
+
 def main():
     converter = AltStoreConverter()
     
     if len(sys.argv) < 3:
         print("Usage:")
-        print("  Single file: python altstore_converter.py input.json output.json [--analyze-ipas]")
-        print("  Batch mode:  python altstore_converter.py input_dir/ output_dir/ [--analyze-ipas]")
+        print("  Single file: python altstore_converter.py input.json output.json [--analyze-ipas] [--privacy-only] [--verbose]")
+        print("  Batch mode:  python altstore_converter.py input_dir/ output_dir/ [--analyze-ipas] [--privacy-only] [--verbose]")
+        print("  --privacy-only reads just Info.plist (via HTTP range requests where possible), skipping entitlements")
         return
     
+    # Per-permission details of the IPA analysis are only logged with --verbose
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    if '--verbose' in sys.argv:
+        log.setLevel(logging.DEBUG)
+    
     input_path = sys.argv[1]
     output_path = sys.argv[2]
-    analyze_ipas = '--analyze-ipas' in sys.argv
+    privacy_only = '--privacy-only' in sys.argv
+    analyze_ipas = '--analyze-ipas' in sys.argv or privacy_only
     
     if analyze_ipas:
         print("⚠️  IPA analysis enabled - this will take significantly longer!")
@@ -598,10 +1116,10 @@ def main():
     
     if os.path.isdir(input_path):
         # Batch mode
-        converter.batch_convert(input_path, output_path, analyze_ipas)
+        converter.batch_convert(input_path, output_path, analyze_ipas, privacy_only)
     else:
         # Single file mode
-        converter.convert_repository(input_path, output_path, analyze_ipas)
+        converter.convert_repository(input_path, output_path, analyze_ipas, privacy_only)
 
 if __name__ == "__main__":
     main()